@@ -5,6 +5,8 @@ to output the  Kendall Tau B correlation coefficient between their ordering
 and the most optimal ordering, as generated by the chosen metric.
 
 If verbose flag is specified, intermediate data in the process can be outputted to stderr.
+Transmission and contact files may be TSV, gzipped TSV, Parquet or Arrow IPC, and the
+counts and matched ordering can be exported as Parquet.
 """
 
 
@@ -37,7 +39,7 @@ def calculateTauB(userOrder) -> None:
         print("%s\t%s\n" % (tau, pvalue))
 
 
-# parse user arguments  [-h] -m METRIC [-i INPUT] [-t TRANMSISSIONHIST] [-c CONTACTNET] -s START [-e END] [-v]
+# parse user arguments  [-h] -m METRIC [-i INPUT] [-t TRANMSISSIONHIST] [-c CONTACTNET] -s START [-e END] [-v] [--countsOut COUNTSOUT] [--orderOut ORDEROUT]
 parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 parser.add_argument('-m', '--metric', required=True, type=float, help="Metric of prioritization (1-6)")
 parser.add_argument('-i', '--input', required=False, type=str, default='stdin', help="Input File - User's Ordering")
@@ -46,6 +48,8 @@ parser.add_argument('-c', '--contactNet', required=False, type=str, default='',
 parser.add_argument('-s', '--start', required=True, type=float, help='Time Start')
 parser.add_argument('-e', '--end', required=False, type=float, default=float('inf'), help='Time End') # end defaults to infinity
 parser.add_argument('-v', '--verbose', required=False, action='store_true', help='Print Intermediate List with Individuals Matched to Counts')
+parser.add_argument('--countsOut', required=False, type=str, default='', help='Parquet Output File - Counts of All Individuals')
+parser.add_argument('--orderOut', required=False, type=str, default='', help="Parquet Output File - User's Ordering Matched to Counts")
 args = parser.parse_args()
 
 # handle input, save into infile var
@@ -67,6 +71,12 @@ countsList = matchInfectorCounts(infectionsDict, order)
 if args.verbose:
     print(countsList, stderr)
 
+# export the ground-truth counts and matched ordering if output files were specified
+if args.countsOut != '':
+    exportCounts(infectionsDict, args.countsOut)
+if args.orderOut != '':
+    exportMatchedOrder(countsList, args.orderOut)
+
 # calculate and output Tau B to stdout
 calculateTauB([x[1] for x in countsList])
 
@@ -16,6 +16,8 @@ from itertools import repeat
 DEF_POINTS_PER_STEP = 10
 METRIC1 = 1; METRIC2 = 2; METRIC3 = 3; METRIC4 = 4; METRIC5 = 5; METRIC6 = 6
 TAB_CHAR = '\t'
+PARQUET_EXTS = ('.parquet', '.pq'); ARROW_EXTS = ('.arrow', '.feather', '.ipc')
+TRANSMISSION_COLUMNS = ['u', 'v', 't']; CONTACT_COLUMNS = ['u', 'v']
 
 
 def pairCounts(transmissionHist, contactNet, lowerBound: int, upperBound: int, metric: float) -> dict:
@@ -44,9 +46,9 @@ def pairCounts(transmissionHist, contactNet, lowerBound: int, upperBound: int, m
         Parameters
         ----------
         tranmissionHist - the file object with data on tranmissions used to build the
-                          dictionary
+                          dictionary (TSV, gzipped TSV, Parquet or Arrow IPC)
         contactNet - the file object with data on the contact network used to build the
-                          dictionary
+                          dictionary (TSV, gzipped TSV, Parquet or Arrow IPC)
         lowerBound - lower bound of time range
         upperBound - upper bound of timerange
         metric - float, specifies the chosen metric
@@ -114,17 +116,10 @@ def directTransmissions(transmissionHist, lowerBound: int, upperBound: int) -> d
         """
 
         infectedPersons= []; people = []; numInfected = dict()
-        lines = opengzip(transmissionHist)
-
-        # Loop over each line in the file.
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip(); v = v.strip() # strip leading/trailing white space
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
+        transmissions = readTransmissions(transmissionHist, lowerBound, upperBound)
 
+        # Loop over each transmission within the given range of years.
+        for u,v,t in transmissions:
             if not u or u == 'None':
                 continue
 
@@ -164,7 +159,7 @@ def bestfitGraph(transmissionHist, lowerBound: int, upperBound: int, numPointsPe
         # build timesInfected, a dict where each person is
         # matched up with a list of times at which they transmitted
         timesInfected = dict()
-        lines = opengzip(transmissionHist)
+        transmissions = readTransmissions(transmissionHist, lowerBound, upperBound)
 
         # Deal with upper bound setting
         isUpperBoundSet = True; latestInfectionTime = -1;
@@ -174,15 +169,8 @@ def bestfitGraph(transmissionHist, lowerBound: int, upperBound: int, numPointsPe
         else:
             latestInfectionTime = upperBound
 
-        # Loop over each line in the transmissions file to build timesInfected
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip(); v = v.strip()
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
-
+        # Loop over each transmission within the time range to build timesInfected
+        for u,v,t in transmissions:
             if u == 'None':
                 continue
 
@@ -190,11 +178,11 @@ def bestfitGraph(transmissionHist, lowerBound: int, upperBound: int, numPointsPe
                 timesInfected[u] = []
 
             # Append this time to u's list
-            timesInfected[u].append(float(t))
+            timesInfected[u].append(t)
 
             # Keep iterating to get the globally latest infection time
-            if not isUpperBoundSet and float(t) > latestInfectionTime:
-                latestInfectionTime = float(t)
+            if not isUpperBoundSet and t > latestInfectionTime:
+                latestInfectionTime = t
 
 
         # Build a dict with users as keys paired with their slopes
@@ -299,19 +287,11 @@ def indirectTransmissions(transmissionHist, numDegrees: int, lowerBound: int, up
         """
 
         infectedPersons= []; people = []
-        lines = opengzip(transmissionHist)
+        transmissions = readTransmissions(transmissionHist, lowerBound, upperBound)
         direct = dict() # will be populated with all of key's indirect transmissions to a specified degree
         
-        # Loop over each line in the file.
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip()
-            v = v.strip()
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
-
+        # Loop over each transmission within the given range of years.
+        for u,v,t in transmissions:
             if u == 'None':
                 continue
 
@@ -366,18 +346,10 @@ def totalTransmissions(transmissionHist, lowerBound: int, upperBound: int) -> di
         """
 
         infectedPersons= []; people = []; numInfected = dict()
-        lines = opengzip(transmissionHist)
-
-        # Loop over each line in the file.
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip()
-            v = v.strip()
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
+        transmissions = readTransmissions(transmissionHist, lowerBound, upperBound)
 
+        # Loop over each transmission within the given range of years.
+        for u,v,t in transmissions:
             if u == 'None':
                 continue
 
@@ -388,15 +360,7 @@ def totalTransmissions(transmissionHist, lowerBound: int, upperBound: int) -> di
 
         numIndirect = dict()
 
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip()
-            v = v.strip()
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
-
+        for u,v,t in transmissions:
             if u == 'None':
                 continue
 
@@ -442,21 +406,10 @@ def numContacts(transmissionHist, lowerBound: int, upperBound: int) -> dict:
 
         infectedPersons= []; people = []
         numberContacts = dict()
-        lines = opengzip(transmissionHist)
-
-        # Loop over each line in the file.
-        for line in lines:
-            # Skip over lines listing the nodes
-            if(line[0:4] == 'NODE'):
-                    continue
-
-            u,v,t,w,x = line.split('\t')
-            u = u.strip()
-            v = v.strip()
-
-            if u == 'None':
-                continue
+        contacts = readContacts(transmissionHist)
 
+        # Loop over each contact in the network.
+        for v,t in contacts:
             # Add person to numberContacts if they don't already exist in the dict
             if v not in numberContacts:
                 numberContacts[v] = 0
@@ -490,18 +443,10 @@ def numContactInfect(transmissionHist, contactNet, lowerBound: int, upperBound:
         """
 
         infectedPersons= []; people = []; numInfected = dict()
-        lines = opengzip(transmissionHist)
-
-        # Loop over each line in the file.
-        for line in lines:
-            u,v,t = line.split(TAB_CHAR)
-            u = u.strip()
-            v = v.strip()
-
-            # Only considers infections within a given range of years
-            if (lowerBound > float(t)) | (float(t) > upperBound):
-                continue
+        transmissions = readTransmissions(transmissionHist, lowerBound, upperBound)
 
+        # Loop over each transmission within the given range of years.
+        for u,v,t in transmissions:
             if u == 'None':
                 continue
 
@@ -513,22 +458,11 @@ def numContactInfect(transmissionHist, contactNet, lowerBound: int, upperBound:
 
         infectedPersons= []; people = []
         totalContactCount = 0
-        lines = opengzip(contactNet)
+        contacts = readContacts(contactNet)
         numberContacts = dict()
 
-        # Loop over each line in the file.
-        for line in lines:
-            # Skip over lines listing the nodes
-            if(line[0:4] == 'NODE'):
-                    continue
-
-            u,v,t,w,x = line.split('\t')
-            u = u.strip()
-            v = v.strip()
-
-            if u == 'None':
-                continue
-
+        # Loop over each contact in the network.
+        for v,t in contacts:
             # Add person to numberContacts if they don't already exist in the dict
             if v not in numberContacts:
                 numberContacts[v] = 0
@@ -597,3 +531,190 @@ def opengzip(transmissionHist: str) -> list:
             lines = [l.strip() for l in transmissionHist.read().strip().splitlines()]
 
         return lines
+
+
+def columnarFormat(path) -> str:
+        """
+        Helper method - Returns 'parquet' or 'ipc' if the path names a columnar
+        file, or None if it should be read as (gzipped) text.
+
+        Parameters
+        ----------
+        path - the path to check. file objects are always treated as text.
+        """
+
+        if not isinstance(path, str):
+            return None
+
+        if path.lower().endswith(PARQUET_EXTS):
+            return 'parquet'
+        if path.lower().endswith(ARROW_EXTS):
+            return 'ipc'
+
+        return None
+
+
+def readColumnar(path: str, columns: list, timeFilter=None):
+        """
+        Helper method - Reads only the requested columns of a Parquet or Arrow IPC
+        file into a pyarrow Table. If timeFilter is given as (lowerBound, upperBound),
+        rows are filtered on the 't' column while scanning, so Parquet row groups
+        outside the time range are skipped without being decoded.
+
+        Parameters
+        ----------
+        path - the Parquet or Arrow IPC file to read
+        columns - the names of the columns to read
+        timeFilter - optional (lowerBound, upperBound) tuple on the 't' column
+        """
+
+        try:
+            import pyarrow.dataset as ds
+        except ImportError:
+            raise ImportError("Reading " + path + " requires pyarrow.\nInstall it with 'pip3 install pyarrow'")
+
+        dataset = ds.dataset(path, format=columnarFormat(path))
+
+        missing = [c for c in columns if c not in dataset.schema.names]
+        if missing:
+            raise ValueError("Missing column(s) " + ", ".join(missing) + " in " + path + ".\nExpected columns: " + ", ".join(columns))
+
+        rowFilter = None
+        if timeFilter is not None:
+            lowerBound, upperBound = timeFilter
+            rowFilter = ds.field('t') >= lowerBound
+            if upperBound != float('inf'):
+                rowFilter = rowFilter & (ds.field('t') <= upperBound)
+
+        return dataset.to_table(columns=columns, filter=rowFilter)
+
+
+def readTransmissions(transmissionHist, lowerBound: int, upperBound: int) -> list:
+        """
+        Helper method - Returns a list of (<infector>, <infectee>, <time>) tuples for
+        every transmission within the given time range. Infectors of seed infections
+        are returned as 'None', as they appear in the TSV format.
+
+        Parquet and Arrow IPC files need 'u', 'v' and 't' columns; only those columns
+        are read and the time range is pushed down into the scan.
+
+        Parameters
+        ----------
+        tranmissionHist - the file object with data on tranmissions
+        lowerBound - lower bound of time range
+        upperBound - upper bound of time range
+        """
+
+        transmissions = []
+
+        if columnarFormat(transmissionHist) is not None:
+            table = readColumnar(transmissionHist, TRANSMISSION_COLUMNS, (lowerBound, upperBound))
+            us, vs, ts = [table.column(c).to_pylist() for c in TRANSMISSION_COLUMNS]
+
+            for u,v,t in zip(us, vs, ts):
+                transmissions.append((str(u).strip(), str(v).strip(), float(t)))
+
+            return transmissions
+
+        for line in opengzip(transmissionHist):
+            u,v,t = line.split(TAB_CHAR)
+            u = u.strip(); v = v.strip() # strip leading/trailing white space
+
+            # Only considers infections within a given range of years
+            if (lowerBound > float(t)) | (float(t) > upperBound):
+                continue
+
+            transmissions.append((u, v, float(t)))
+
+        return transmissions
+
+
+def readContacts(contactNet) -> list:
+        """
+        Helper method - Returns a list of (<individual>, <individual>) tuples, one for
+        each edge in the contact network.
+
+        Parquet and Arrow IPC files need 'u' and 'v' columns holding the two individuals
+        of each edge; only those columns are read.
+
+        Parameters
+        ----------
+        contactNet - the file object with data on the contact network
+        """
+
+        contacts = []
+
+        if columnarFormat(contactNet) is not None:
+            table = readColumnar(contactNet, CONTACT_COLUMNS)
+            us, vs = [table.column(c).to_pylist() for c in CONTACT_COLUMNS]
+
+            for u,v in zip(us, vs):
+                contacts.append((str(u).strip(), str(v).strip()))
+
+            return contacts
+
+        for line in opengzip(contactNet):
+            # Skip over lines listing the nodes
+            if(line[0:4] == 'NODE'):
+                    continue
+
+            u,v,t,w,x = line.split(TAB_CHAR)
+            u = u.strip()
+            v = v.strip()
+
+            if u == 'None':
+                continue
+
+            contacts.append((v, t.strip()))
+
+        return contacts
+
+
+def writeParquet(path: str, columns: dict) -> None:
+        """
+        Helper method - Writes a dict of column name to list of values as a Parquet file.
+
+        Parameters
+        ----------
+        path - the Parquet file to write
+        columns - a dict with column names as keys and lists of values as values
+        """
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Writing " + path + " requires pyarrow.\nInstall it with 'pip3 install pyarrow'")
+
+        pq.write_table(pa.table(columns), path)
+
+
+def exportCounts(infectionsDict: dict, path: str) -> None:
+        """
+        Writes the count of every individual, as returned by pairCounts, to a Parquet
+        file with columns 'individual' and 'count'.
+
+        Parameters
+        ----------
+        infectionsDict - a dict with keys as individuals and values as their counts
+        path - the Parquet file to write
+        """
+
+        writeParquet(path, {'individual': list(infectionsDict.keys()),
+                            'count': list(infectionsDict.values())})
+
+
+def exportMatchedOrder(countsList: list, path: str) -> None:
+        """
+        Writes the user's ordering matched to counts, as returned by matchInfectorCounts,
+        to a Parquet file with columns 'rank' (1 is highest priority), 'individual' and 'count'.
+
+        Parameters
+        ----------
+        countsList - a list of tuples (<individual>, <count>) in the user's order
+        path - the Parquet file to write
+        """
+
+        writeParquet(path, {'rank': list(range(1, len(countsList) + 1)),
+                            'individual': [x[0] for x in countsList],
+                            'count': [x[1] for x in countsList]})